@@ -0,0 +1,48 @@
+# Standard imports
+import sys
+import json
+import warnings
+from argparse import ArgumentParser
+
+# Third-party imports
+from . import bench_clients, bench_logger, bench_requests, bench_threads
+from ._utils import environment, print_results
+
+
+SUITES = ("clients", "requests", "threads", "logger")
+
+
+def main() -> None:
+    """ Runs the benchmark suites and prints the results (optionally also saving them as JSON to compare releases) """
+    parser = ArgumentParser(prog = "python -m benchmarks", description = "Runs the toolkit4life benchmarks against local stand-ins")
+    parser.add_argument("suites", nargs = "*", metavar = "suite", help = f"The suites to run: {', '.join(SUITES)} (default: all)")
+    parser.add_argument("--rows", type = int, default = 10000, help = "Number of rows for the client benchmarks")
+    parser.add_argument("--requests", type = int, default = 50, help = "Number of requests per fan-out")
+    parser.add_argument("--threads", type = int, default = 100, help = "Number of threads per ThreadPool")
+    parser.add_argument("--calls", type = int, default = 10000, help = "Number of calls for the logger benchmarks")
+    parser.add_argument("--repeat", type = int, default = 5, help = "Number of samples per benchmark")
+    parser.add_argument("--json", metavar = "PATH", help = "Also write the results to the given JSON file")
+    args = parser.parse_args()
+
+    suites = args.suites or SUITES
+    for suite in suites:
+        if suite not in SUITES: parser.error(f"unknown suite '{suite}' (choose from {', '.join(SUITES)})")
+    warnings.simplefilter("ignore")     # e.g. the deprecated hmset in RedisClient
+
+    results = []
+    if "clients" in suites: results += bench_clients.run(rows = args.rows, repeat = args.repeat)
+    if "requests" in suites: results += bench_requests.run(requests = args.requests, repeat = args.repeat)
+    if "threads" in suites: results += bench_threads.run(threads = args.threads, repeat = args.repeat)
+    if "logger" in suites: results += bench_logger.run(calls = args.calls, repeat = args.repeat)
+
+    env = environment()
+    print(" | ".join(f"{key}: {value}" for key, value in env.items()))
+    print_results(results)
+
+    if args.json is not None:
+        with open(args.json, "w") as f:
+            json.dump({"environment": env, "parameters": vars(args), "results": results}, f, indent = 2)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
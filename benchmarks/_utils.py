@@ -0,0 +1,77 @@
+# Standard imports
+import os
+import sys
+import platform
+from time import perf_counter
+from statistics import median
+from typing import Callable, List
+
+
+def measure(name: str, func: Callable, ops: int = 1, number: int = 1, repeat: int = 5, setup: Callable = None) -> dict:
+    """
+        Times the given function and returns the result as a dictionary
+
+        Parameters:
+            name (str): The name of the benchmark. Keep it stable, it's what results are compared by across releases
+            func (Callable): The function to be timed
+            ops (int): The number of operations (rows, requests, calls, ...) a single call of func performs
+            number (int): The number of times func is called per sample
+            repeat (int): The number of samples to take
+            setup (Callable): A function that is called (untimed) before every sample
+        Returns:
+            (dict) The name, operations, best and median seconds per call and operations per second
+    """
+    samples = []
+    for _ in range(repeat):
+        if setup is not None: setup()
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((perf_counter() - start) / number)
+
+    return {
+        "name": name,
+        "ops": ops,
+        "best": min(samples),
+        "median": median(samples),
+        "ops_per_sec": ops / median(samples),
+    }
+
+
+def skipped(name: str, reason: str) -> dict:
+    """ Returns a result for a benchmark that could not run in this environment """
+    return {"name": name, "skipped": reason}
+
+
+def environment() -> dict:
+    """ Returns the package version and platform details, so results from different releases and machines can be told apart """
+    try:
+        from importlib.metadata import version
+        package_version = version("toolkit4life")
+    except Exception:
+        package_version = "dev"
+
+    return {
+        "toolkit4life": package_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def print_results(results: List[dict], file = sys.stdout) -> None:
+    """ Prints the results as a table """
+    print(f"{'benchmark':<45} {'ops/sec':>14} {'median':>12} {'best':>12}", file = file)
+    print("-" * 86, file = file)
+    for result in results:
+        if "skipped" in result:
+            print(f"{result['name']:<45} {'skipped: ' + result['skipped']}", file = file)
+            continue
+        print(f"{result['name']:<45} {result['ops_per_sec']:>14,.1f} {_duration(result['median']):>12} {_duration(result['best']):>12}", file = file)
+
+
+def _duration(seconds: float) -> str:
+    """ Formats the given duration with a readable unit """
+    if seconds >= 1: return f"{seconds:.3f} s"
+    if seconds >= 1e-3: return f"{seconds * 1e3:.3f} ms"
+    return f"{seconds * 1e6:.3f} us"
@@ -0,0 +1,28 @@
+# Standard imports
+import os
+from typing import List
+from contextlib import redirect_stdout
+
+# Third-party imports
+from toolkit4life.utils import logger
+from ._utils import measure
+
+
+def _add(a: int, b: int) -> int:
+    return a + b
+
+
+def run(calls: int, repeat: int) -> List[dict]:
+    """ Runs the logger decorator overhead benchmarks, compared to calling the undecorated function """
+    decorated = {
+        "logger.undecorated": _add,
+        "logger.status": logger.status()(_add),
+        "logger.text": logger.text(on_success = "added", on_failure = "failed")(_add),
+        "logger.restart_on_crash": logger.restart_on_crash(retries = 3)(_add),
+    }
+
+    results = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):   # Measure the decorators, not the terminal
+        for name, func in decorated.items():
+            results.append(measure(name, lambda func = func: [func(i, i) for i in range(calls)], ops = calls, repeat = repeat))
+    return results
@@ -0,0 +1,71 @@
+# Standard imports
+from time import sleep
+from typing import List
+from threading import Thread
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+# Third-party imports
+from toolkit4life.utils.requests import Requests
+from toolkit4life.utils.threads import ThreadPool
+from ._utils import measure
+
+
+class _Server(ThreadingMixIn, HTTPServer):
+    """ HTTP server that handles every request in its own thread, so fanned-out requests are served concurrently """
+    daemon_threads = True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """ Replies to every GET with a small body, after the server's configured delay """
+
+    def do_GET(self) -> None:
+        sleep(self.server.delay)
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, format, *args) -> None:
+        """ Silences the per-request logs """
+
+
+def serve(delay: float) -> HTTPServer:
+    """ Starts a local HTTP server on a free port in a background thread """
+    server = _Server(("127.0.0.1", 0), _Handler)
+    server.delay = delay
+    Thread(target = server.serve_forever, daemon = True).start()
+    return server
+
+
+def run(requests: int, repeat: int, delay: float = 0.005) -> List[dict]:
+    """
+        Runs the request benchmarks against a local server
+
+        Parameters:
+            requests (int): The number of requests per fan-out
+            repeat (int): The number of samples to take
+            delay (float): The simulated server latency in seconds
+    """
+    server = serve(delay)
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    client = Requests(timeout = 10)
+    results = []
+
+    try:
+        results.append(measure("requests.get", lambda: client.get(url), ops = 1, number = 20, repeat = repeat))
+        results.append(measure(
+            "requests.fanout_sequential", ops = requests, repeat = repeat,
+            func = lambda: [client.get(url) for _ in range(requests)],
+        ))
+        results.append(measure(
+            "requests.fanout_threadpool", ops = requests, repeat = repeat,
+            func = lambda: ThreadPool({f"request-{i}": (client.get, (url,)) for i in range(requests)}).start_and_join(),
+        ))
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
@@ -0,0 +1,26 @@
+# Standard imports
+from typing import List
+
+# Third-party imports
+from toolkit4life.utils.threads import Thread, ThreadPool
+from ._utils import measure
+
+
+def _noop(value: int = 0) -> int:
+    return value
+
+
+def run(threads: int, repeat: int) -> List[dict]:
+    """ Runs the Thread and ThreadPool overhead benchmarks (the targets do no work, so only the overhead is measured) """
+    configs = {f"thread-{i}": (_noop, (i,)) for i in range(threads)}
+
+    def single_thread():
+        thread = Thread(target = _noop, args = (1,))
+        thread.start()
+        return thread.join()
+
+    return [
+        measure("threads.direct_call", lambda: [_noop(i) for i in range(threads)], ops = threads, repeat = repeat),
+        measure("threads.thread", single_thread, ops = 1, number = 100, repeat = repeat),
+        measure("threads.threadpool", lambda: ThreadPool(configs).start_and_join(), ops = threads, repeat = repeat),
+    ]
@@ -1,12 +1,20 @@
 # Standard imports
+import re
 import sqlalchemy
+from time import monotonic
+from typing import Callable
 from pandas import DataFrame, read_sql_query
 from sqlalchemy_utils.functions import database_exists, create_database
 
 
+# Statements that change the schema, and so invalidate the cached metadata (matched at the start of every statement, once comments are removed)
+DDL_PATTERN = re.compile(r"(?:^|;)\s*(CREATE|DROP|ALTER|TRUNCATE|RENAME|COMMENT)\b", re.IGNORECASE)
+COMMENT_PATTERN = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+
 class SQLAlchemy():
 
-    def __init__(self, engine: str, host: str, port: str, database: str, username: str, password: str) -> None:
+    def __init__(self, engine: str, host: str, port: str, database: str, username: str, password: str, metadata_ttl: float = 0) -> None:
         """
             Creates and initializes a PostgreSQL engine instance that connects to the database
 
@@ -17,6 +25,7 @@ class SQLAlchemy():
                 database (str): Name of the database
                 username (str): Username for authentication/privileges
                 password (str): Password for authentication
+                metadata_ttl (float): Number of seconds table/schema/column lookups are cached for (defaults to 0, which disables the cache)
         """
         self.engine = engine
         self.username = username
@@ -25,20 +34,94 @@ class SQLAlchemy():
         self.port = port
         self.database = database
 
+        self.metadata_ttl = metadata_ttl
+        self._metadata_cache = {}   # (kind, schema, name) -> (timestamp, value)
+
+
+    def _select(self, query: str, index_col: str = None, params: dict = None) -> DataFrame:
+        """
+            Executes the given query and returns the results as a DataFrame. Bound parameters are interpolated by the driver, so the database
+            still plans the query on every call (see PostgresClient._select_prepared for server-side prepared statements)
+
+            Parameters:
+                query (str): The query to execute. If params is given, values are referenced as bound parameters (e.g. ":id")
+                index_col (str): The column to be used as the index of the DataFrame
+                params (dict): Values of the bound parameters in the query
+            Returns:
+                (DataFrame) The results of the query
+        """
+        if params is None:
+            return read_sql_query(sql = query, con = self.engine, index_col = index_col)
+        return read_sql_query(sql = sqlalchemy.text(query), con = self.engine, index_col = index_col, params = params)
+
+
+    def _execute(self, query: str, params = None) -> None:
+        """
+            Executes the given query. As with _select, the database plans it on every call
+
+            Parameters:
+                query (str): The query to execute. If params is given, values are referenced as bound parameters (e.g. ":id")
+                params (dict | list): Values of the bound parameters in the query. A list of dicts executes the query once per item
+        """
+        if params is None:
+            self.engine.execute(query)
+        else:
+            self.engine.execute(sqlalchemy.text(query), params)
+
+        # DDL run indirectly (e.g. inside functions or DO blocks) is not detected, call invalidate_metadata() after it
+        if self._metadata_cache and DDL_PATTERN.search(COMMENT_PATTERN.sub(" ", query)):
+            self.invalidate_metadata()
 
-    def _select(self, query: str, index_col: str = None) -> DataFrame:
-        """ Executes the given query and returns the results as a DataFrame """
-        return read_sql_query(sql = query, con = self.engine, index_col = index_col)
 
+    def _cached_metadata(self, key: tuple, loader: Callable):
+        """ Returns the cached metadata for the given key, calling the loader if it's missing or expired """
+        now = monotonic()
+        cached = self._metadata_cache.get(key)
+        if cached is not None and now - cached[0] < self.metadata_ttl:
+            return cached[1]
 
-    def _execute(self, query: str) -> None:
-        """ Executes the given query """
-        self.engine.execute(query)
+        value = loader(sqlalchemy.inspect(self.engine))
+        if self.metadata_ttl > 0:
+            self._metadata_cache[key] = (now, value)
+        return value
 
 
-    def table_exists(self, name: str) -> bool:
+    def invalidate_metadata(self, name: str = None, schema: str = None) -> None:
+        """
+            Invalidates the cached metadata
+
+            Parameters:
+                name (str): The name of the table to invalidate
+                schema (str): The schema to invalidate. If name is None, all of its tables are invalidated too
+            Leaving both as None clears the whole cache
+        """
+        if name is None and schema is None:
+            self._metadata_cache.clear()
+            return
+
+        for key in list(self._metadata_cache):
+            kind, _schema, _name = key
+            if name is None:
+                stale = kind == "schemas" or _schema == schema
+            else:
+                stale = _name == name and (schema is None or _schema == schema)
+            if stale:
+                self._metadata_cache.pop(key, None)     # May already be gone if invalidated from another thread
+
+
+    def table_exists(self, name: str, schema: str = None) -> bool:
         """ Checks if the given table exists in the database """
-        return sqlalchemy.inspect(self.engine).has_table(name)
+        return self._cached_metadata(("table", schema, name), lambda inspector: inspector.has_table(name, schema = schema))
+
+
+    def schema_exists(self, name: str) -> bool:
+        """ Checks if the given schema exists in the database """
+        return name in self._cached_metadata(("schemas", None, None), lambda inspector: inspector.get_schema_names())
+
+
+    def get_columns(self, name: str, schema: str = None) -> list:
+        """ Returns the columns of the given table as a list of dicts (name, type, nullable, default, ...) """
+        return self._cached_metadata(("columns", schema, name), lambda inspector: inspector.get_columns(name, schema = schema))
 
 
     def create_database_if_not_exists(self, name: str) -> None:
@@ -50,6 +133,7 @@ class SQLAlchemy():
     def create_schema_if_not_exists(self, name: str) -> None:
         """ Creates a new Schema if not already exists """
         self._execute(f"CREATE SCHEMA IF NOT EXISTS {name}")
+        self.invalidate_metadata(schema = name)
 
 
     def _insert(self, df: DataFrame, name: str, if_exists: str = "append", index: bool = False,index_label: str = None) -> None:
@@ -63,4 +147,5 @@ class SQLAlchemy():
                 index (bool): Whether to drop the index
                 index_label (str): The name of the index column
         """
-        df.to_sql(name, con = self.engine, if_exists = if_exists, index = index, index_label = index_label)
\ No newline at end of file
+        df.to_sql(name, con = self.engine, if_exists = if_exists, index = index, index_label = index_label)
+        self.invalidate_metadata(name)     # The table may have been created or replaced
@@ -1,16 +1,24 @@
 # Standard imports
+import re
 import uuid
 import pandas as pd
+from hashlib import md5
+from collections import OrderedDict
 from sqlalchemy import create_engine
+from psycopg2.errors import FeatureNotSupported
 from urllib.parse import quote_plus as urlquote
 
 # Third-party imports
 from ._sqlalchemy import SQLAlchemy
 
 
+# ":name" bound parameters (skipping "::" casts and times such as '10:30')
+BIND_PATTERN = re.compile(r"(?<![:\w]):([A-Za-z_]\w*)")
+
+
 class PostgresClient(SQLAlchemy):
 
-    def __init__(self, host: str, port: str, username: str, password: str, database: str) -> None:
+    def __init__(self, host: str, port: str, username: str, password: str, database: str, metadata_ttl: float = 0, prepared_cache_size: int = 100) -> None:
         """
             Creates and initializes a PostgreSQL engine instance that connects to the database
 
@@ -20,10 +28,95 @@ class PostgresClient(SQLAlchemy):
                 username (str): Username for authentication/privileges
                 password (str): Password for authentication
                 database (str): Name of the database
+                metadata_ttl (float): Number of seconds table/schema/column lookups are cached for (defaults to 0, which disables the cache)
+                prepared_cache_size (int): Maximum number of server-side prepared statements kept per connection by _select_prepared/_execute_prepared
         """
-        super().__init__(engine = "postgresql", host = host, port = port, database = database, username = username, password = password)
+        super().__init__(engine = "postgresql", host = host, port = port, database = database, username = username, password = password, metadata_ttl = metadata_ttl)
         self.engine = create_engine(self.connection_string)
 
+        self.prepared_cache_size = prepared_cache_size
+        self._prepared_generation = 0   # Bumped to discard the prepared statements of every connection
+
+
+    def _select_prepared(self, query: str, params: dict = {}, index_col: str = None) -> pd.DataFrame:
+        """
+            Executes the given query as a server-side prepared statement and returns the results as a DataFrame. Unlike _select, PostgreSQL plans
+            the query once per connection and reuses the plan on the following calls, which pays off for small queries that run many times
+
+            Parameters:
+                query (str): The query to execute, referencing values as bound parameters (e.g. ":id"). Only SELECT, INSERT, UPDATE, DELETE and VALUES can be prepared
+                params (dict): Values of the bound parameters in the query
+                index_col (str): The column to be used as the index of the DataFrame
+            Returns:
+                (DataFrame) The results of the query
+        """
+        columns, rows = self._run_prepared(query, [params], fetch = True)
+        df = pd.DataFrame.from_records(rows, columns = columns)
+        return df.set_index(index_col) if index_col is not None else df
+
+
+    def _execute_prepared(self, query: str, params = {}) -> None:
+        """
+            Executes the given query as a server-side prepared statement (see _select_prepared)
+
+            Parameters:
+                query (str): The query to execute, referencing values as bound parameters (e.g. ":id")
+                params (dict | list): Values of the bound parameters in the query. A list of dicts executes the query once per item, in a single transaction
+        """
+        self._run_prepared(query, params if isinstance(params, list) else [params], fetch = False)
+
+
+    def _run_prepared(self, query: str, params_list: list, fetch: bool) -> tuple:
+        """ Executes the prepared query once per params and returns the column names and rows of the last execution (if fetch is set) """
+        for attempt in range(2):
+            try:
+                with self.engine.begin() as connection:
+                    dbapi_connection = connection.connection
+                    cursor = dbapi_connection.cursor()
+                    try:
+                        name, names = self._prepare(cursor, dbapi_connection.info, query)
+                        arguments = f" ({', '.join(['%s'] * len(names))})" if names else ""
+                        for params in params_list:
+                            cursor.execute(f"EXECUTE {name}{arguments}", [params[_] for _ in names])
+                        if fetch:
+                            return [column[0] for column in cursor.description], cursor.fetchall()
+                        return None, None
+                    finally:
+                        cursor.close()
+            except FeatureNotSupported as ex:
+                # The schema changed under the prepared statements (e.g. "cached plan must not change result type"), prepare them again
+                if attempt > 0 or "cached plan" not in str(ex): raise
+                self._prepared_generation += 1
+
+
+    def _prepare(self, cursor, info: dict, query: str) -> tuple:
+        """ Prepares the query on the cursor's connection (once per connection) and returns the statement name and the order of its parameters """
+        if info.get("prepared_generation") != self._prepared_generation:
+            if info.get("prepared_statements"): cursor.execute("DEALLOCATE ALL")
+            info["prepared_statements"] = OrderedDict()     # query -> (name, parameter names), in least recently used order
+            info["prepared_generation"] = self._prepared_generation
+        statements = info["prepared_statements"]
+
+        if query in statements:
+            statements.move_to_end(query)
+            return statements[query]
+
+        # Replace ":name" with positional "$n" parameters, as PREPARE expects
+        names = []
+        def positional(match) -> str:
+            if match.group(1) not in names: names.append(match.group(1))
+            return f"${names.index(match.group(1)) + 1}"
+        statement = BIND_PATTERN.sub(positional, query)
+
+        name = f"toolkit4life_{md5(query.encode()).hexdigest()[:16]}"
+        cursor.execute(f"PREPARE {name} AS {statement}")    # Prepared statements outlive the transaction, even if it's rolled back
+        statements[query] = (name, names)
+
+        if len(statements) > self.prepared_cache_size:
+            oldest_name, _ = statements.popitem(last = False)[1]
+            cursor.execute(f"DEALLOCATE {oldest_name}")
+        return name, names
+
 
     def upsert_df(self, df: pd.DataFrame, table_name: str) -> None:
         """
@@ -51,19 +144,19 @@ class PostgresClient(SQLAlchemy):
         update_column_stmt = ", ".join([f'"{col}" = EXCLUDED."{col}"' for col in column_names])
 
         # Create a unique constraint on the index columns for the ON CONFILCT clause
-        self.engine.execute(f"""
+        self._execute(f"""
             ALTER TABLE "{table_name}" DROP CONSTRAINT IF EXISTS unique_constraint_{temp_table_name};
             ALTER TABLE "{table_name}" ADD CONSTRAINT unique_constraint_{temp_table_name} UNIQUE ({index_names_sql_txt});
         """)
 
         # Apply the upsert and remove the temporary table
-        self.engine.execute(f"""
+        self._execute(f"""
             INSERT INTO "{table_name}" ({headers_sql_txt}) 
             SELECT {headers_sql_txt} FROM "{temp_table_name}"
             ON CONFLICT ({index_names_sql_txt}) DO UPDATE 
             SET {update_column_stmt};
         """)
-        self.engine.execute(f"DROP TABLE {temp_table_name}")
+        self._execute(f"DROP TABLE {temp_table_name}")
 
 
     @property
@@ -5,7 +5,7 @@ from pandas import DataFrame
 
 class RedisClient():
 
-    def __init__(self, host: str, port: str, password: str = None, db: int = 0, fresh_start: bool = False) -> None:
+    def __init__(self, host: str, port: str, password: str = None, db: int = 0, fresh_start: bool = False, connect_args: dict = {}) -> None:
         """
             Initialized the Redis cache database instance and redis engine
 
@@ -15,6 +15,7 @@ class RedisClient():
                 password (str): The password for the redis database
                 db (int): The database to use. defaults to 0 if not spesified
                 fresh_start (str): Whether to clear the redis database. Setting the argument to True can result in data-loss!
+                connect_args (dict): Extra arguments for the connection pool (e.g. connection_class)
         """
 
         # Initialize the redis engine
@@ -24,7 +25,8 @@ class RedisClient():
                 port = port,
                 password = password,
                 decode_responses = True,    # Stringify the values
-                db = db                     # Dedicated database
+                db = db,                    # Dedicated database
+                **connect_args
             )
         )
 
@@ -0,0 +1,158 @@
+# Standard imports
+import json
+import pandas as pd
+
+# Third-party imports
+from .redis import RedisClient
+from .postgres import PostgresClient
+
+
+class PostgresRedisSync():
+    """ Incrementally materializes a PostgreSQL table into Redis hashes, using a high-water mark column to only copy changed rows """
+
+    def __init__(self, postgres: PostgresClient, redis: RedisClient, table: str, key_column: str = "id", watermark_column: str = "updated_at", tombstone_column: str = None, columns: list = None, schema: str = None, key_prefix: str = "", chunk_size: int = 10000, checkpoint_key: str = None, lookback = None) -> None:
+        """
+            Constructor
+
+            Parameters:
+                postgres (PostgresClient): The client to read the rows from
+                redis (RedisClient): The client to write the rows to
+                table (str): The name of the source table
+                key_column (str): The unique column used as the redis key (also breaks ties between equal watermarks)
+                watermark_column (str): A column that increases whenever a row changes (e.g. updated_at or a serial id). Rows where it is NULL are ignored.
+                    NOTE: A row whose watermark is lower than one already synced (e.g. updated_at stamped by a transaction that commits late) is missed, unless lookback covers the gap or the watermark is assigned in commit order
+                tombstone_column (str): A soft-delete column (e.g. is_deleted or deleted_at). Rows where it's set are deleted from redis instead of written. Hard-deleted rows can't be detected
+                columns (list): The columns to copy into the redis hashes. Defaults to all columns
+                schema (str): The schema of the source table
+                key_prefix (str): A prefix to add to every redis key
+                chunk_size (int): The number of rows to read and write per round trip
+                checkpoint_key (str): The redis key that the sync state is kept in. Defaults to "__sync__:<key_prefix><schema.table>", outside the data keys
+                lookback: How far behind the last synced watermark each sync starts re-reading rows, in watermark units (e.g. timedelta(minutes = 5) for timestamps, an int for ids). Re-written rows are idempotent
+        """
+        self.postgres = postgres
+        self.redis = redis
+        self.table = table
+        self.schema = schema
+        self.key_column = key_column
+        self.watermark_column = watermark_column
+        self.tombstone_column = tombstone_column
+        self.key_prefix = key_prefix
+        self.chunk_size = chunk_size
+        self.lookback = lookback
+
+        # Make sure the columns the sync depends on are always selected
+        if columns is not None:
+            columns = list(columns)
+            for column in (key_column, watermark_column, tombstone_column):
+                if column is not None and column not in columns:
+                    columns.append(column)
+        self.columns = columns
+
+        qualified_name = f"{schema}.{table}" if schema else table
+        self.checkpoint_key = checkpoint_key if checkpoint_key is not None else f"__sync__:{key_prefix}{qualified_name}"
+
+
+    @property
+    def checkpoint(self) -> dict:
+        """ Returns the last synced watermark and key (empty if nothing has been synced yet) """
+        return self.redis.get_value_from_key(self.checkpoint_key)
+
+
+    def reset(self) -> None:
+        """ Forgets the checkpoint, so the next sync copies the whole table again """
+        self.redis.delete_key(self.checkpoint_key)
+
+
+    def sync(self) -> dict:
+        """
+            Copies the rows that changed since the last sync into redis, one chunk at a time
+
+            Returns:
+                (dict) The number of chunks read, and keys upserted and deleted
+        """
+        stats = {"chunks": 0, "upserted": 0, "deleted": 0}
+        checkpoint = self.checkpoint
+
+        # Re-read the lookback window first, then page through the rest after the last read row
+        if self.lookback is not None and "lookback_from" in checkpoint:
+            query, params = self._query("lookback"), {"watermark": checkpoint["lookback_from"]}
+        elif checkpoint:
+            query, params = self._query("checkpoint"), {"watermark": checkpoint["watermark"], "key": checkpoint["key"]}
+        else:
+            query, params = self._query(None), {}
+
+        while True:
+            df = self.postgres._select(query, params = {**params, "limit": self.chunk_size})
+            if df.empty: break
+
+            # Read from the columns rather than df.iloc[-1], which upcasts all-numeric rows to float
+            last_watermark, last_key = df[self.watermark_column].iloc[-1], df[self.key_column].iloc[-1]
+            checkpoint = {"watermark": str(last_watermark), "key": str(last_key)}
+            if self.lookback is not None:
+                checkpoint["lookback_from"] = str(last_watermark - self.lookback)
+            upserted, deleted = self._write(df, checkpoint)
+
+            stats["chunks"] += 1
+            stats["upserted"] += upserted
+            stats["deleted"] += deleted
+            if len(df) < self.chunk_size: break     # Caught up with the source table
+            query, params = self._query("checkpoint"), {"watermark": checkpoint["watermark"], "key": checkpoint["key"]}
+
+        return stats
+
+
+    def _query(self, start: str) -> str:
+        """ Returns the query that reads the next chunk of changed rows, starting after the checkpoint, from the lookback watermark or (if None) from the beginning """
+        table = f'"{self.schema}"."{self.table}"' if self.schema else f'"{self.table}"'
+        columns = ", ".join([f'"{column}"' for column in self.columns]) if self.columns is not None else "*"
+        watermark, key = f'"{self.watermark_column}"', f'"{self.key_column}"'
+
+        # Keyset pagination on (watermark, key), so rows sharing a watermark are never skipped between chunks
+        where = f"{watermark} IS NOT NULL"
+        if start == "checkpoint":
+            where += f" AND ({watermark}, {key}) > (:watermark, :key)"
+        elif start == "lookback":
+            where += f" AND {watermark} >= :watermark"
+        return f"SELECT {columns} FROM {table} WHERE {where} ORDER BY {watermark}, {key} LIMIT :limit"
+
+
+    def _write(self, df: pd.DataFrame, checkpoint: dict) -> tuple:
+        """ Writes a chunk and its checkpoint to redis in a single pipelined transaction and returns the number of keys upserted and deleted """
+        upserted, deleted = 0, 0
+        with self.redis.engine.pipeline() as pipe:
+            for row in df.to_dict("records"):
+                key = f"{self.key_prefix}{row[self.key_column]}"
+                pipe.delete(key)    # Drop stale fields, since NULL values are not stored
+
+                if self.tombstone_column is not None and _is_set(row[self.tombstone_column]):
+                    deleted += 1
+                    continue
+
+                pipe.hset(key, mapping = {column: _to_redis_value(value) for column, value in row.items() if not _is_null(value)})
+                upserted += 1
+
+            pipe.hset(self.checkpoint_key, mapping = checkpoint)
+            pipe.execute()
+        return upserted, deleted
+
+
+
+def _is_null(value) -> bool:
+    """ Checks whether a value is missing (lists and dicts, e.g. from array and JSON columns, never are) """
+    return pd.api.types.is_scalar(value) and pd.isna(value)
+
+
+
+def _is_set(value) -> bool:
+    """ Checks whether a tombstone value marks the row as deleted """
+    return not _is_null(value) and bool(value)
+
+
+
+def _to_redis_value(value):
+    """ Converts a value into a type that redis accepts """
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, default = str)
+    if isinstance(value, bool) or not isinstance(value, (str, bytes, int, float)):
+        return str(value)
+    return value
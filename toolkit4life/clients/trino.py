@@ -8,7 +8,7 @@ from ._sqlalchemy import SQLAlchemy
 
 class TrinoClient(SQLAlchemy):
 
-    def __init__(self, host: str, port: str, catalog: str, schema: str, username: str, password: str, connect_args: dict = {}) -> None:
+    def __init__(self, host: str, port: str, catalog: str, schema: str, username: str, password: str, connect_args: dict = {}, metadata_ttl: float = 0) -> None:
         """
             Creates and initializes a PostgreSQL engine instance that connects to the database
 
@@ -20,8 +20,9 @@ class TrinoClient(SQLAlchemy):
                 username (str): Username for authentication/privileges
                 password (str): Password for authentication
                 connect_args (dict): Extrac arguments for the connection to be made
+                metadata_ttl (float): Number of seconds table/schema/column lookups are cached for (defaults to 0, which disables the cache)
         """
-        super().__init__(engine = "trino", host = host, port = port, database = catalog, username = username, password = password)
+        super().__init__(engine = "trino", host = host, port = port, database = catalog, username = username, password = password, metadata_ttl = metadata_ttl)
         self.schema = schema
 
         self.engine = create_engine(self.connection_string, connect_args = connect_args)